@@ -6,7 +6,12 @@ This script demonstrates multi-strategy backtesting using popular Python librari
 to compare with the Elixir implementation in backtest_examples.livemd
 
 Dependencies:
-pip install yfinance pandas numpy matplotlib plotly dash scipy ta-lib
+pip install yfinance pandas numpy matplotlib plotly dash scipy
+
+Optional:
+pip install ta-lib  # C indicator implementations; falls back to pandas/NumPy without it
+pip install numba  # JIT-compiles the backtest kernel; falls back to NumPy without it
+pip install pyarrow  # Enables the daily Parquet cache of downloaded data
 
 Author: Generated for Quant Explorer comparison
 """
@@ -18,10 +23,293 @@ import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from numpy.lib.stride_tricks import sliding_window_view
+import functools
+import os
+import threading
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so decorated functions run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+@njit(cache=True, fastmath=True, inline='always')
+def _backtest_core(close, sig, cap, buy_cost, sell_proceeds):
+    """Bar-by-bar all-in/all-out state machine, compiled with Numba"""
+    n = close.shape[0]
+    position = np.zeros(n)
+    cash = np.empty(n)
+    pv = np.empty(n)
+    trade_idx = np.empty(n, dtype=np.int64)
+    trade_price = np.empty(n)
+    trade_shares = np.empty(n)
+    trade_type = np.empty(n, dtype=np.int8)
+    
+    if n == 0:
+        return position, cash, pv, trade_idx, trade_price, trade_shares, trade_type
+    
+    shares = 0.0
+    balance = cap
+    trade_count = 0
+    cash[0] = cap
+    pv[0] = cap
+    
+    for i in range(1, n):
+        price = close[i]
+        
+        if sig[i] == 1 and shares == 0:  # Buy signal
+            # Invest all available cash
+            shares = balance / (price * buy_cost)
+            balance = balance - (shares * price * buy_cost)
+            trade_idx[trade_count] = i
+            trade_price[trade_count] = price
+            trade_shares[trade_count] = shares
+            trade_type[trade_count] = 1
+            trade_count += 1
+            
+        elif sig[i] == -1 and shares > 0:  # Sell signal
+            # Sell all shares
+            balance = balance + (shares * price * sell_proceeds)
+            trade_idx[trade_count] = i
+            trade_price[trade_count] = price
+            trade_shares[trade_count] = shares
+            trade_type[trade_count] = -1
+            trade_count += 1
+            shares = 0.0
+        
+        # Portfolio value is fused into the same pass; holdings are never materialized
+        position[i] = shares
+        cash[i] = balance
+        pv[i] = balance + shares * price
+    
+    return (position, cash, pv, trade_idx[:trade_count], trade_price[:trade_count],
+            trade_shares[:trade_count], trade_type[:trade_count])
+
+@njit(cache=True, fastmath=True)
+def _run_backtest_numba(close, sig, cap, comm, slip):
+    """Compiled backtest with commission and slippage passed at runtime"""
+    return _backtest_core(close, sig, cap, 1 + comm + slip, 1 - comm - slip)
+
+@functools.lru_cache(maxsize=None)
+def _specialized_backtest(comm, slip):
+    """Compile a backtest kernel with this commission/slippage baked in as constants"""
+    buy_cost = 1 + comm + slip
+    sell_proceeds = 1 - comm - slip
+    
+    # Closure variables are frozen at compile time, so LLVM folds the cost factors
+    @njit(cache=True, fastmath=True)
+    def run(close, sig, cap):
+        return _backtest_core(close, sig, cap, buy_cost, sell_proceeds)
+    
+    return run
+
+def _run_backtest_numpy(close, sig, cap, comm, slip):
+    """Vectorized equivalent of _run_backtest_numba using NumPy segment scans"""
+    n = len(close)
+    buy_cost = 1 + comm + slip
+    sell_proceeds = 1 - comm - slip
+    
+    # Positions only change at signal transitions: a buy fires on the first
+    # buy signal while flat, a sell on the first sell signal while long.
+    # Bar 0 is never traded, matching the bar-by-bar kernel.
+    candidates = np.flatnonzero(sig[1:]) + 1
+    candidate_sig = sig[candidates]
+    prev_sig = np.concatenate(([-1], candidate_sig[:-1]))
+    trade_idx = candidates[candidate_sig != prev_sig]
+    trade_price = close[trade_idx]
+    is_buy = np.arange(len(trade_idx)) % 2 == 0
+    
+    # Each round trip multiplies capital by sell_price*proceeds / (buy_price*cost)
+    buy_price = trade_price[is_buy]
+    sell_price = trade_price[~is_buy]
+    round_trips = (sell_price * sell_proceeds) / (buy_price[:len(sell_price)] * buy_cost)
+    capital_before_buy = cap * np.concatenate(([1.0], np.cumprod(round_trips)))[:len(buy_price)]
+    shares = capital_before_buy / (buy_price * buy_cost)
+    
+    trade_shares = np.repeat(shares, 2)[:len(trade_idx)]
+    cash_before_trade = np.repeat(capital_before_buy, 2)[:len(trade_idx)]
+    buy_cash = cash_before_trade - trade_shares * trade_price * buy_cost
+    sell_cash = trade_shares * trade_price * sell_proceeds
+    
+    # Segment k+1 runs from trade k up to trade k+1; segment 0 is the initial flat state
+    segment = np.searchsorted(trade_idx, np.arange(n), side='right')
+    position = np.concatenate(([0.0], np.where(is_buy, trade_shares, 0.0)))[segment]
+    cash = np.concatenate(([float(cap)], np.where(is_buy, buy_cash, sell_cash)))[segment]
+    # Fused pv = cash + position * close in one output buffer, with no holdings temporary
+    pv = np.multiply(position, close)
+    pv += cash
+    trade_type = np.where(is_buy, 1, -1).astype(np.int8)
+    
+    return position, cash, pv, trade_idx, trade_price, trade_shares, trade_type
+
+def _run_backtest(close, sig, cap, comm, slip):
+    """Run the backtest core: a kernel specialized per (commission, slippage), or NumPy without numba"""
+    if NUMBA_AVAILABLE:
+        return _specialized_backtest(comm, slip)(close, sig, cap)
+    return _run_backtest_numpy(close, sig, cap, comm, slip)
+
+@njit(cache=True)
+def _wilder_rsi(close, period):
+    """RSI with Wilder's recursive smoothing, seeded by the mean of the first period moves"""
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    if n <= period:
+        return rsi
+    
+    delta = np.diff(close)
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
+    avg_gain = gain[:period].mean()
+    avg_loss = loss[:period].mean()
+    
+    for i in range(period, n):
+        if i > period:
+            avg_gain = (avg_gain * (period - 1) + gain[i - 1]) / period
+            avg_loss = (avg_loss * (period - 1) + loss[i - 1]) / period
+        # 100 - 100/(1 + gain/loss), written so a zero loss yields 100 (flat prices yield 0)
+        total = avg_gain + avg_loss
+        rsi[i] = 100 * avg_gain / total if total > 0 else 0.0
+    
+    return rsi
+
+@njit(cache=True)
+def _sma_seeded_ema(values, period):
+    """EMA seeded with the SMA of the first period values, NaN during warmup (as TA-Lib)
+    
+    Leading NaNs (e.g. the MACD line's warmup) are skipped before seeding.
+    """
+    n = values.shape[0]
+    ema = np.full(n, np.nan)
+    start = 0
+    while start < n and np.isnan(values[start]):
+        start += 1
+    if n - start < period:
+        return ema
+    
+    k = 2.0 / (period + 1)
+    prev = values[start:start + period].mean()
+    ema[start + period - 1] = prev
+    for i in range(start + period, n):
+        prev = prev + k * (values[i] - prev)
+        ema[i] = prev
+    return ema
+
+@functools.lru_cache(maxsize=64)
+def _ema_cached(close_bytes, span):
+    """EMA over a float64 buffer; keyed on the raw bytes so equal series share one result"""
+    close = np.frombuffer(close_bytes, dtype=np.float64)
+    if TALIB_AVAILABLE:
+        ema = talib.EMA(close, timeperiod=span)
+    else:
+        ema = _sma_seeded_ema(close, span)
+    ema.flags.writeable = False
+    return ema
+
+def _ema(close, span):
+    """EMA of close, reused across strategies (e.g. EMA(12,26) and MACD(12,26,9)) via the cache"""
+    return _ema_cached(np.ascontiguousarray(close, dtype=np.float64).tobytes(), span)
+
+def _sma(close, period):
+    """Simple moving average of close, NaN during the warmup bars
+    
+    Without TA-Lib, windows of up to 64 bars are averaged over a sliding window view and
+    longer ones from running sums; as with rolling().mean(), a window containing a NaN is NaN.
+    """
+    if TALIB_AVAILABLE:
+        return talib.SMA(close, timeperiod=period)
+    
+    sma = np.full(len(close), np.nan)
+    if len(close) < period:
+        return sma
+    if period <= 64:
+        sma[period - 1:] = sliding_window_view(close, period).mean(axis=1)
+    else:
+        # Long windows: O(N) running-sum form instead of O(N * period) window means.
+        # NaNs are summed as zero and counted separately so only windows containing one are NaN.
+        missing = np.isnan(close)
+        running = np.cumsum(np.concatenate(([0.0], np.where(missing, 0.0, close))))
+        running_missing = np.cumsum(np.concatenate(([0], missing)))
+        window_sum = running[period:] - running[:-period]
+        window_missing = running_missing[period:] - running_missing[:-period]
+        sma[period - 1:] = np.where(window_missing > 0, np.nan, window_sum / period)
+    return sma
+
+def _rsi(close, period):
+    """Wilder RSI of close, NaN during the warmup bars"""
+    if TALIB_AVAILABLE:
+        return talib.RSI(close, timeperiod=period)
+    return _wilder_rsi(close, period)
+
+def _macd(close, fast_period, slow_period, signal_period):
+    """MACD line and its signal line, built from the shared EMA cache"""
+    macd = _ema(close, fast_period) - _ema(close, slow_period)
+    return macd, _ema(macd, signal_period)
+
+def _previous(values):
+    """Shift values one bar forward along the first axis, leaving NaN on the first bar"""
+    return np.concatenate((np.full_like(values[:1], np.nan), values[:-1]))
+
+def _crossover_signals(fast, slow):
+    """Return 1 where fast crosses above slow, -1 where it crosses below, 0 otherwise
+    
+    Accepts 1-D series or (bars, pairs) matrices; crossovers are detected along axis 0.
+    """
+    diff = np.asarray(fast, dtype=np.float64) - np.asarray(slow, dtype=np.float64)
+    prev_diff = _previous(diff)
+    # NaN warmup bars compare False on both sides, so they never signal
+    buy = (diff > 0) & (prev_diff <= 0)
+    sell = (diff < 0) & (prev_diff >= 0)
+    return np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
+
+def _threshold_signals(values, lower, upper):
+    """Return 1 where values cross above lower, -1 where they cross below upper, 0 otherwise"""
+    values = np.asarray(values, dtype=np.float64)
+    prev_values = _previous(values)
+    buy = (values > lower) & (prev_values <= lower)
+    sell = (values < upper) & (prev_values >= upper)
+    return np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
+
+# Annual risk-free rate for the Sharpe ratio, shared by backtest and the compiled sweep
+RISK_FREE_RATE = 0.02
+
+@dataclass
+class BacktestArrays:
+    """Backtest state as one contiguous array per field (structure of arrays)"""
+    close: np.ndarray
+    signal: np.ndarray
+    position: np.ndarray
+    cash: np.ndarray
+    pv: np.ndarray
+    trade_idx: np.ndarray
+    trade_price: np.ndarray
+    trade_shares: np.ndarray
+    trade_type: np.ndarray
+    
+    @property
+    def holdings(self):
+        """Market value of the position, derived on demand rather than tracked per bar"""
+        return self.position * self.close
+
 class TradingStrategy:
     """Base class for trading strategies"""
     
@@ -31,108 +319,96 @@ class TradingStrategy:
         self.commission = commission
         self.slippage = slippage
         
-    def generate_signals(self, data):
-        """Override in subclasses to generate trading signals"""
+    def generate_signals(self, close):
+        """Override in subclasses to generate trading signals from a close price array"""
         raise NotImplementedError
         
-    def backtest(self, data):
-        """Run backtest for the strategy"""
-        df = data.copy()
-        
-        # Generate signals
-        signals = self.generate_signals(df)
-        df['signal'] = signals
+    def simulate(self, close, signals):
+        """Run the backtest core on plain arrays, without touching any DataFrame"""
+        close = np.ascontiguousarray(close, dtype=np.float64)
+        sig = np.ascontiguousarray(signals, dtype=np.int8)
+        position, cash, pv, trade_idx, trade_price, trade_shares, trade_type = _run_backtest(
+            close, sig, float(self.initial_capital), self.commission, self.slippage
+        )
+        return BacktestArrays(close, sig, position, cash, pv, trade_idx, trade_price, trade_shares, trade_type)
         
-        # Initialize portfolio tracking
-        df['position'] = 0.0
-        df['portfolio_value'] = self.initial_capital
-        df['cash'] = self.initial_capital
-        df['holdings'] = 0.0
-        df['trades'] = 0
+    def backtest(self, data, signals=None, metrics_only=False):
+        """Run backtest for the strategy, optionally on precomputed signals
         
-        position = 0.0
-        cash = self.initial_capital
-        trades = []
+        With metrics_only=True only the summary metrics are returned and the
+        reporting DataFrame and trade list are never built (parameter sweeps).
+        """
+        close = data['close'].to_numpy(dtype=np.float64)
         
-        for i in range(1, len(df)):
-            prev_position = position
-            signal = df.iloc[i]['signal']
-            price = df.iloc[i]['close']
-            
-            if signal == 1 and position == 0:  # Buy signal
-                # Calculate position size (invest all available cash)
-                shares_to_buy = cash / (price * (1 + self.commission + self.slippage))
-                position = shares_to_buy
-                cash = cash - (shares_to_buy * price * (1 + self.commission + self.slippage))
-                trades.append({
-                    'date': df.index[i],
-                    'type': 'buy',
-                    'price': price,
-                    'shares': shares_to_buy
-                })
-                
-            elif signal == -1 and position > 0:  # Sell signal
-                # Sell all shares
-                cash = cash + (position * price * (1 - self.commission - self.slippage))
-                trades.append({
-                    'date': df.index[i],
-                    'type': 'sell',
-                    'price': price,
-                    'shares': position
-                })
-                position = 0.0
-            
-            df.iloc[i, df.columns.get_loc('position')] = position
-            df.iloc[i, df.columns.get_loc('cash')] = cash
-            df.iloc[i, df.columns.get_loc('holdings')] = position * price
-            df.iloc[i, df.columns.get_loc('portfolio_value')] = cash + (position * price)
-            df.iloc[i, df.columns.get_loc('trades')] = len(trades)
+        # Generate signals
+        if signals is None:
+            signals = self.generate_signals(close)
+        arrays = self.simulate(close, signals)
         
         # Calculate performance metrics
-        returns = df['portfolio_value'].pct_change().dropna()
+        portfolio_value = arrays.pv
+        returns = np.diff(portfolio_value) / portfolio_value[:-1]
         
         results = {
-            'data': df,
-            'trades': trades,
-            'final_value': df['portfolio_value'].iloc[-1],
-            'total_return': (df['portfolio_value'].iloc[-1] - self.initial_capital) / self.initial_capital,
-            'max_drawdown': self._calculate_max_drawdown(df['portfolio_value']),
-            'win_rate': self._calculate_win_rate(trades),
-            'trade_count': len(trades),
+            'final_value': portfolio_value[-1],
+            'total_return': (portfolio_value[-1] - self.initial_capital) / self.initial_capital,
+            'max_drawdown': self._calculate_max_drawdown(portfolio_value),
+            'win_rate': self._calculate_win_rate(arrays.trade_price),
+            'trade_count': len(arrays.trade_idx),
             'sharpe_ratio': self._calculate_sharpe_ratio(returns),
-            'volatility': returns.std() * np.sqrt(252)  # Annualized volatility
+            'volatility': returns.std(ddof=1) * np.sqrt(252)  # Annualized volatility
         }
         
+        if metrics_only:
+            return results
+        
+        # The reporting frame is assembled once, from the finished arrays
+        df = pd.DataFrame({
+            'close': arrays.close,
+            'signal': arrays.signal,
+            'position': arrays.position,
+            'cash': arrays.cash,
+            'holdings': arrays.holdings,
+            'portfolio_value': arrays.pv,
+            'trades': np.searchsorted(arrays.trade_idx, np.arange(len(close)), side='right')
+        }, index=data.index)
+        
+        trades = [
+            {
+                'date': df.index[i],
+                'type': 'buy' if kind == 1 else 'sell',
+                'price': price,
+                'shares': shares
+            }
+            for i, kind, price, shares in zip(arrays.trade_idx, arrays.trade_type, arrays.trade_price, arrays.trade_shares)
+        ]
+        
+        results.update(data=df, arrays=arrays, trades=trades)
         return results
     
     def _calculate_max_drawdown(self, portfolio_values):
         """Calculate maximum drawdown"""
-        peak = portfolio_values.expanding(min_periods=1).max()
-        drawdown = (portfolio_values - peak) / peak
+        pv = np.asarray(portfolio_values, dtype=np.float64)
+        peak = np.maximum.accumulate(pv)
+        drawdown = (pv - peak) / peak
         return drawdown.min()
     
-    def _calculate_win_rate(self, trades):
-        """Calculate win rate from trades"""
-        if len(trades) < 2:
+    def _calculate_win_rate(self, trade_prices):
+        """Calculate win rate from alternating buy/sell trade prices"""
+        total_trade_pairs = len(trade_prices) // 2
+        if total_trade_pairs == 0:
             return 0.0
-            
-        winning_trades = 0
-        for i in range(1, len(trades), 2):  # Pairs of buy/sell
-            if i < len(trades):
-                buy_price = trades[i-1]['price']
-                sell_price = trades[i]['price']
-                if sell_price > buy_price:
-                    winning_trades += 1
         
-        total_trade_pairs = len(trades) // 2
-        return winning_trades / total_trade_pairs if total_trade_pairs > 0 else 0.0
+        buy_prices = trade_prices[0:2 * total_trade_pairs:2]
+        sell_prices = trade_prices[1:2 * total_trade_pairs:2]
+        return float(np.mean(sell_prices > buy_prices))
     
-    def _calculate_sharpe_ratio(self, returns, risk_free_rate=0.02):
+    def _calculate_sharpe_ratio(self, returns, risk_free_rate=RISK_FREE_RATE):
         """Calculate Sharpe ratio"""
-        if len(returns) == 0 or returns.std() == 0:
+        if len(returns) == 0 or returns.std(ddof=1) == 0:
             return 0.0
         excess_returns = returns.mean() * 252 - risk_free_rate  # Annualized
-        return excess_returns / (returns.std() * np.sqrt(252))
+        return excess_returns / (returns.std(ddof=1) * np.sqrt(252))
 
 class SMAStrategy(TradingStrategy):
     """Simple Moving Average Crossover Strategy"""
@@ -142,29 +418,9 @@ class SMAStrategy(TradingStrategy):
         self.fast_period = fast_period
         self.slow_period = slow_period
     
-    def generate_signals(self, data):
-        df = data.copy()
-        df[f'sma_{self.fast_period}'] = df['close'].rolling(window=self.fast_period).mean()
-        df[f'sma_{self.slow_period}'] = df['close'].rolling(window=self.slow_period).mean()
-        
-        signals = np.zeros(len(df))
-        
-        for i in range(1, len(df)):
-            fast_current = df.iloc[i][f'sma_{self.fast_period}']
-            slow_current = df.iloc[i][f'sma_{self.slow_period}']
-            fast_prev = df.iloc[i-1][f'sma_{self.fast_period}']
-            slow_prev = df.iloc[i-1][f'sma_{self.slow_period}']
-            
-            # Buy signal: fast MA crosses above slow MA
-            if (fast_current > slow_current and fast_prev <= slow_prev and 
-                not pd.isna(fast_current) and not pd.isna(slow_current)):
-                signals[i] = 1
-            # Sell signal: fast MA crosses below slow MA
-            elif (fast_current < slow_current and fast_prev >= slow_prev and 
-                  not pd.isna(fast_current) and not pd.isna(slow_current)):
-                signals[i] = -1
-                
-        return signals
+    def generate_signals(self, close):
+        # Buy when the fast MA crosses above the slow MA, sell when it crosses below
+        return _crossover_signals(_sma(close, self.fast_period), _sma(close, self.slow_period))
 
 class EMAStrategy(TradingStrategy):
     """Exponential Moving Average Crossover Strategy"""
@@ -174,27 +430,9 @@ class EMAStrategy(TradingStrategy):
         self.fast_period = fast_period
         self.slow_period = slow_period
     
-    def generate_signals(self, data):
-        df = data.copy()
-        df[f'ema_{self.fast_period}'] = df['close'].ewm(span=self.fast_period).mean()
-        df[f'ema_{self.slow_period}'] = df['close'].ewm(span=self.slow_period).mean()
-        
-        signals = np.zeros(len(df))
-        
-        for i in range(1, len(df)):
-            fast_current = df.iloc[i][f'ema_{self.fast_period}']
-            slow_current = df.iloc[i][f'ema_{self.slow_period}']
-            fast_prev = df.iloc[i-1][f'ema_{self.fast_period}']
-            slow_prev = df.iloc[i-1][f'ema_{self.slow_period}']
-            
-            # Buy signal: fast EMA crosses above slow EMA
-            if (fast_current > slow_current and fast_prev <= slow_prev):
-                signals[i] = 1
-            # Sell signal: fast EMA crosses below slow EMA
-            elif (fast_current < slow_current and fast_prev >= slow_prev):
-                signals[i] = -1
-                
-        return signals
+    def generate_signals(self, close):
+        # Buy when the fast EMA crosses above the slow EMA, sell when it crosses below
+        return _crossover_signals(_ema(close, self.fast_period), _ema(close, self.slow_period))
 
 class RSIStrategy(TradingStrategy):
     """RSI Mean Reversion Strategy"""
@@ -205,30 +443,12 @@ class RSIStrategy(TradingStrategy):
         self.oversold = oversold
         self.overbought = overbought
     
-    def generate_signals(self, data):
-        df = data.copy()
-        
-        # Calculate RSI
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=self.period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=self.period).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
+    def generate_signals(self, close):
+        # Calculate RSI (Wilder smoothing, as in TA-Lib)
+        rsi = _rsi(close, self.period)
         
-        signals = np.zeros(len(df))
-        
-        for i in range(1, len(df)):
-            rsi = df.iloc[i]['rsi']
-            prev_rsi = df.iloc[i-1]['rsi']
-            
-            # Buy signal: RSI crosses above oversold threshold
-            if rsi > self.oversold and prev_rsi <= self.oversold:
-                signals[i] = 1
-            # Sell signal: RSI crosses below overbought threshold
-            elif rsi < self.overbought and prev_rsi >= self.overbought:
-                signals[i] = -1
-                
-        return signals
+        # Buy when RSI crosses above oversold, sell when it crosses below overbought
+        return _threshold_signals(rsi, self.oversold, self.overbought)
 
 class MACDStrategy(TradingStrategy):
     """MACD Crossover Strategy"""
@@ -239,43 +459,146 @@ class MACDStrategy(TradingStrategy):
         self.slow_period = slow_period
         self.signal_period = signal_period
     
-    def generate_signals(self, data):
-        df = data.copy()
-        
+    def generate_signals(self, close):
         # Calculate MACD
-        ema_fast = df['close'].ewm(span=self.fast_period).mean()
-        ema_slow = df['close'].ewm(span=self.slow_period).mean()
-        df['macd'] = ema_fast - ema_slow
-        df['macd_signal'] = df['macd'].ewm(span=self.signal_period).mean()
-        df['macd_histogram'] = df['macd'] - df['macd_signal']
+        macd, macd_signal = _macd(close, self.fast_period, self.slow_period, self.signal_period)
         
-        signals = np.zeros(len(df))
-        
-        for i in range(1, len(df)):
-            macd = df.iloc[i]['macd']
-            macd_signal = df.iloc[i]['macd_signal']
-            prev_macd = df.iloc[i-1]['macd']
-            prev_macd_signal = df.iloc[i-1]['macd_signal']
-            
-            # Buy signal: MACD crosses above signal line
-            if macd > macd_signal and prev_macd <= prev_macd_signal:
-                signals[i] = 1
-            # Sell signal: MACD crosses below signal line
-            elif macd < macd_signal and prev_macd >= prev_macd_signal:
-                signals[i] = -1
-                
-        return signals
+        # Buy when MACD crosses above its signal line, sell when it crosses below
+        return _crossover_signals(macd, macd_signal)
+
+SWEEP_METRICS = ('final_value', 'total_return', 'max_drawdown', 'win_rate', 'trade_count', 'sharpe_ratio', 'volatility')
 
-def fetch_data(symbol, period="2y"):
-    """Fetch stock data using yfinance"""
+@njit(cache=True)
+def _crossover_kernel(fast, slow):
+    """Scalar-loop equivalent of _crossover_signals for one pair of series"""
+    n = fast.shape[0]
+    sig = np.zeros(n, dtype=np.int8)
+    for i in range(1, n):
+        diff = fast[i] - slow[i]
+        prev_diff = fast[i - 1] - slow[i - 1]
+        if diff > 0 and prev_diff <= 0:
+            sig[i] = 1
+        elif diff < 0 and prev_diff >= 0:
+            sig[i] = -1
+    return sig
+
+@njit(cache=True)
+def _metrics_kernel(pv, trade_price, cap, risk_free_rate, out):
+    """Write the SWEEP_METRICS of one backtest into out, mirroring TradingStrategy.backtest"""
+    n = pv.shape[0]
+    out[0] = pv[-1]
+    out[1] = (pv[-1] - cap) / cap
+    
+    peak = pv[0]
+    max_drawdown = 0.0
+    for i in range(n):
+        peak = max(peak, pv[i])
+        max_drawdown = min(max_drawdown, (pv[i] - peak) / peak)
+    out[2] = max_drawdown
+    
+    pairs = trade_price.shape[0] // 2
+    wins = 0
+    for k in range(pairs):
+        if trade_price[2 * k + 1] > trade_price[2 * k]:
+            wins += 1
+    out[3] = wins / pairs if pairs > 0 else 0.0
+    out[4] = trade_price.shape[0]
+    
+    # Sharpe and volatility use the sample standard deviation (ddof=1) of bar returns
+    mean = 0.0
+    for i in range(1, n):
+        mean += (pv[i] - pv[i - 1]) / pv[i - 1]
+    mean /= max(n - 1, 1)
+    var = 0.0
+    for i in range(1, n):
+        r = (pv[i] - pv[i - 1]) / pv[i - 1]
+        var += (r - mean) ** 2
+    std = np.sqrt(var / (n - 2)) if n > 2 else np.nan
+    out[5] = 0.0 if n < 2 or std == 0 else (mean * 252 - risk_free_rate) / (std * np.sqrt(252))
+    out[6] = std * np.sqrt(252)
+
+@njit(parallel=True, cache=True)
+def _sma_sweep_kernel(close, sma_matrix, fast_idx, slow_idx, cap, comm, slip, risk_free_rate):
+    """Backtest every SMA pair in parallel; row k of the result holds the SWEEP_METRICS of pair k"""
+    out = np.empty((fast_idx.shape[0], 7))
+    for k in prange(fast_idx.shape[0]):
+        sig = _crossover_kernel(sma_matrix[:, fast_idx[k]], sma_matrix[:, slow_idx[k]])
+        _, _, pv, _, trade_price, _, _ = _run_backtest_numba(close, sig, cap, comm, slip)
+        _metrics_kernel(pv, trade_price, cap, risk_free_rate, out[k])
+    return out
+
+def sma_parameter_sweep(data, fast_periods, slow_periods, metrics_only=True, **kwargs):
+    """Backtest every (fast, slow) SMA crossover pair from one shared matrix of SMAs
+    
+    Returns summary metrics per pair by default; pass metrics_only=False for full results.
+    """
+    pairs = [(fast, slow) for fast in fast_periods for slow in slow_periods if fast < slow]
+    if not pairs:
+        return {}
+    
+    # Each distinct period is averaged once into an (N, K) matrix
+    close = data['close'].to_numpy(dtype=np.float64)
+    periods = sorted({period for pair in pairs for period in pair})
+    column = {period: k for k, period in enumerate(periods)}
+    sma_matrix = np.column_stack([_sma(close, period) for period in periods])
+    
+    fast_idx = np.array([column[fast] for fast, _ in pairs])
+    slow_idx = np.array([column[slow] for _, slow in pairs])
+    
+    if metrics_only and NUMBA_AVAILABLE:
+        # Independent backtests run across all cores inside one compiled prange loop
+        template = SMAStrategy(**kwargs)
+        metrics = _sma_sweep_kernel(
+            close, sma_matrix, fast_idx, slow_idx,
+            float(template.initial_capital), template.commission, template.slippage, RISK_FREE_RATE
+        )
+        results = {}
+        for (fast, slow), row in zip(pairs, metrics):
+            result = dict(zip(SWEEP_METRICS, row.tolist()))
+            result['trade_count'] = int(result['trade_count'])
+            results[f"SMA({fast},{slow})"] = result
+        return results
+    
+    # All crossover masks in a single 2-D pass: column k holds the signals for pairs[k]
+    signals = _crossover_signals(sma_matrix[:, fast_idx], sma_matrix[:, slow_idx])
+    
+    results = {}
+    for k, (fast, slow) in enumerate(pairs):
+        strategy = SMAStrategy(fast_period=fast, slow_period=slow, **kwargs)
+        results[strategy.name] = strategy.backtest(data, signals=signals[:, k], metrics_only=metrics_only)
+    return results
+
+CACHE_DIR = ".cache"
+
+def fetch_data(symbol, period="2y", cache_dir=CACHE_DIR):
+    """Fetch stock data using yfinance, cached as Parquet for the rest of the day"""
+    cache_path = os.path.join(cache_dir, f"{symbol}_{period}_{date.today()}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"Ignoring unreadable cache {cache_path}: {e}")
+    
     try:
         ticker = yf.Ticker(symbol)
         data = ticker.history(period=period)
         data.columns = data.columns.str.lower()
-        return data
     except Exception as e:
         print(f"Error fetching data for {symbol}: {e}")
         return None
+    
+    if not data.empty:
+        # Best-effort: write to a temp file and rename it into place so readers never see a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            data.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Could not cache data for {symbol}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return data
 
 def calculate_buy_hold_performance(data, initial_capital):
     """Calculate buy and hold benchmark performance"""
@@ -365,24 +688,25 @@ def create_performance_comparison_chart(results, symbol):
                 row=1, col=1
             )
         
-        # Signal subplot
-        fig.add_trace(
-            go.Scatter(
-                x=result['data'].index,
-                y=result['data']['signal'] + i * 3,  # Offset signals vertically
-                mode='markers',
-                name=f'{strategy_name} Signals',
-                marker=dict(
-                    symbol=['circle' if s == 0 else ('triangle-up' if s == 1 else 'triangle-down') 
-                           for s in result['data']['signal']],
-                    size=[4 if s == 0 else 8 for s in result['data']['signal']],
-                    color=[color if s != 0 else 'lightgray' for s in result['data']['signal']]
+        # Signal subplot: one uniformly styled trace per signal type, offset vertically per strategy
+        dates = result['data'].index
+        signal = result['data']['signal'].to_numpy()
+        for value, symbol_name, label in ((1, 'triangle-up', 'Buy'), (-1, 'triangle-down', 'Sell')):
+            mask = signal == value
+            if not mask.any():
+                continue
+            fig.add_trace(
+                go.Scatter(
+                    x=dates[mask],
+                    y=np.full(mask.sum(), value + i * 3),
+                    mode='markers',
+                    name=f'{strategy_name} {label} Signals',
+                    marker=dict(symbol=symbol_name, size=8, color=color),
+                    showlegend=False,
+                    hovertemplate=f'<b>{strategy_name} {label.upper()}</b><br>Date: %{{x}}<extra></extra>'
                 ),
-                showlegend=False,
-                hovertemplate=f'<b>{strategy_name}</b><br>Date: %{{x}}<br>Signal: %{{y}}<extra></extra>'
-            ),
-            row=2, col=1
-        )
+                row=2, col=1
+            )
     
     # Update layout
     fig.update_layout(
@@ -433,49 +757,108 @@ def print_performance_summary(results, symbol):
         
         print(f"{strategy_name:<25} | {return_str:<10} | {dd_str:<10} | {trades_str:<8} | {sharpe_str:<8} | {win_rate_str:<10} | {final_str}")
 
+def _run_symbol(shm_name, length, index, strategy_specs):
+    """Backtest every strategy on one symbol's close prices in shared memory (runs in a worker process)
+    
+    All strategies for a symbol run in the same worker so they share its EMA cache.
+    Returns (name, result, error) tuples in strategy order.
+    """
+    shm = SharedMemory(name=shm_name)
+    try:
+        # Copy out of the shared block so the returned DataFrames outlive it
+        close = np.array(np.ndarray((length,), dtype=np.float64, buffer=shm.buf))
+    finally:
+        shm.close()
+    data = pd.DataFrame({'close': close}, index=index)
+    
+    outcomes = []
+    for strategy_cls, kwargs in strategy_specs:
+        strategy = strategy_cls(**kwargs)
+        try:
+            result = strategy.backtest(data)
+        except Exception as e:
+            outcomes.append((strategy.name, None, str(e)))
+            continue
+        # The arrays repeat the reporting frame's columns; keep them out of the pickled reply
+        result.pop('arrays')
+        outcomes.append((strategy.name, result, None))
+    return outcomes
+
 def main():
     """Main execution function"""
     print("Python Multi-Strategy Backtest - Quant Explorer Comparison")
     print("=" * 60)
     
-    # Fetch data
+    # Fetch data concurrently; each download is network-bound
     symbols = ['AAPL', 'MSFT']
+    datasets = {}
     
-    for symbol in symbols:
-        print(f"\nFetching data for {symbol}...")
-        data = fetch_data(symbol, period="2y")
-        
+    print(f"\nFetching data for {', '.join(symbols)}...")
+    with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+        fetched = dict(zip(symbols, executor.map(functools.partial(fetch_data, period="2y"), symbols)))
+    
+    for symbol, data in fetched.items():
+        print(f"\n{symbol}:")
         if data is None:
             print(f"Failed to fetch data for {symbol}")
             continue
             
         print(f"Data shape: {data.shape}")
         print(f"Date range: {data.index[0].date()} to {data.index[-1].date()}")
-        
-        # Initialize strategies
-        strategies = [
-            SMAStrategy(fast_period=10, slow_period=30),
-            SMAStrategy(fast_period=20, slow_period=50),
-            EMAStrategy(fast_period=12, slow_period=26),
-            RSIStrategy(period=14, oversold=30, overbought=70),
-            MACDStrategy(fast_period=12, slow_period=26, signal_period=9)
-        ]
-        
-        # Run backtests
-        results = {}
-        print(f"\nRunning backtests for {symbol}...")
-        
-        for strategy in strategies:
-            print(f"  Testing {strategy.name}...")
-            try:
-                result = strategy.backtest(data)
-                results[strategy.name] = result
-                print(f"    ✓ Final Value: ${result['final_value']:,.2f}")
-                print(f"    ✓ Return: {result['total_return']*100:.2f}%")
-                print(f"    ✓ Max Drawdown: {abs(result['max_drawdown'])*100:.2f}%")
-                print(f"    ✓ Trades: {result['trade_count']}")
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
+        datasets[symbol] = data
+    
+    # Strategies are described as (class, kwargs) so each worker builds its own instance
+    strategy_specs = [
+        (SMAStrategy, dict(fast_period=10, slow_period=30)),
+        (SMAStrategy, dict(fast_period=20, slow_period=50)),
+        (EMAStrategy, dict(fast_period=12, slow_period=26)),
+        (RSIStrategy, dict(period=14, oversold=30, overbought=70)),
+        (MACDStrategy, dict(fast_period=12, slow_period=26, signal_period=9))
+    ]
+    # One task per symbol so its strategies share EMAs; each backtest itself stays sequential
+    completed = {symbol: {} for symbol in datasets}
+    shared_blocks = []
+    print(f"\nRunning {len(datasets) * len(strategy_specs)} backtests on {os.cpu_count()} workers...")
+    
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {}
+            for symbol, data in datasets.items():
+                # Only close prices are published; no strategy reads the other columns
+                close = data['close'].to_numpy(dtype=np.float64)
+                shm = SharedMemory(create=True, size=max(close.nbytes, 1))
+                shared_blocks.append(shm)
+                np.ndarray(close.shape, dtype=np.float64, buffer=shm.buf)[:] = close
+                
+                future = executor.submit(_run_symbol, shm.name, len(close), data.index, strategy_specs)
+                futures[future] = symbol
+            
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    outcomes = future.result()
+                except Exception as e:
+                    print(f"  {symbol}: ✗ Error: {e}")
+                    continue
+                
+                for name, result, error in outcomes:
+                    print(f"  {symbol} {name}...")
+                    if error is not None:
+                        print(f"    ✗ Error: {error}")
+                        continue
+                    completed[symbol][name] = result
+                    print(f"    ✓ Final Value: ${result['final_value']:,.2f}")
+                    print(f"    ✓ Return: {result['total_return']*100:.2f}%")
+                    print(f"    ✓ Max Drawdown: {abs(result['max_drawdown'])*100:.2f}%")
+                    print(f"    ✓ Trades: {result['trade_count']}")
+    finally:
+        for shm in shared_blocks:
+            shm.close()
+            shm.unlink()
+    
+    for symbol in datasets:
+        # Workers return their strategies in declaration order
+        results = completed[symbol]
         
         if results:
             # Print summary
@@ -493,8 +876,17 @@ def main():
             # Optionally show chart (requires browser)
             # fig.show()
         
+        # SMA parameter sweep
+        sweep = sma_parameter_sweep(datasets[symbol], fast_periods=range(5, 30, 5), slow_periods=(30, 50, 100, 150, 200))
+        if sweep:
+            print(f"\nSMA parameter sweep for {symbol} ({len(sweep)} pairs), top 5 by return:")
+            ranked = sorted(sweep.items(), key=lambda item: item[1]['total_return'], reverse=True)
+            for name, result in ranked[:5]:
+                print(f"  {name:<15} | Return: {result['total_return']*100:7.2f}% | "
+                      f"Max DD: {abs(result['max_drawdown'])*100:5.1f}% | Trades: {result['trade_count']}")
+        
         print(f"\nCompleted analysis for {symbol}")
         print("-" * 50)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()